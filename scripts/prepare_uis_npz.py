@@ -0,0 +1,29 @@
+"""Generate usklearn/datasets/data/uis.npz from the embedded UIS CSV.
+
+Stores already-typed columns (categorical variables as integer codes)
+so fetch_uis can load them directly without parsing or encoding."""
+
+import os.path
+
+import numpy as np
+
+from usklearn.datasets.base import _read_csv
+from usklearn.datasets._data import uis_data
+from usklearn.datasets.uis import (_FEATURE_DESCR, _TREATMENT_DESCR,
+                                   _TARGET_DESCR)
+from io import StringIO
+
+D = _read_csv(StringIO(uis_data),
+              feature_attrs=_FEATURE_DESCR,
+              treatment_attrs=_TREATMENT_DESCR,
+              target_attrs=_TARGET_DESCR,
+              total_attrs=17)
+
+arrays = dict(zip(D.feature_names, D.data))
+for name in D.target_names + D.treatment_names:
+    arrays[name] = D[name]
+
+path = os.path.join(os.path.dirname(__file__), "..",
+                    "usklearn", "datasets", "data", "uis.npz")
+np.savez_compressed(path, **arrays)
+print("saved", os.path.abspath(path), {n:a.dtype for n, a in arrays.items()})
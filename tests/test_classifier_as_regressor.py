@@ -31,6 +31,46 @@ def test_classifier_as_regressor_pos_label():
     assert pred_y[:3] == approx(1/3, abs=1e-3)
     assert pred_y[3:] == approx(2/3, abs=1e-3)
 
+def test_classifier_as_regressor_refit():
+    # refitting must update the fitted attributes seeded into __dict__
+    lr = LogisticRegression(penalty=None)
+    lr_reg = ClassifierAsRegressor(lr)
+    X, y = _make_data()
+    lr_reg.fit(X, y)
+    assert list(lr_reg.classes_) == [0, 1]
+    assert lr_reg.n_features_in_ == 1
+
+    X2 = [[1.0, 0], [1, 1], [0, 0], [0, 1], [2, 0], [2, 1]]
+    y2 = [0, 1, 2, 0, 1, 2]
+    lr_reg.fit(X2, y2)
+    assert list(lr_reg.classes_) == [0, 1, 2]
+    assert lr_reg.n_features_in_ == 2
+
+def test_classifier_as_regressor_old_pickle():
+    # models pickled before fit cached the bound response method and
+    # pos_label must still predict
+    lr = LogisticRegression(penalty=None)
+    lr_reg = ClassifierAsRegressor(lr)
+    X, y = _make_data()
+    lr_reg.fit(X, y)
+    del lr_reg._bound_resp, lr_reg._pos_label, lr_reg._output_is_matrix
+
+    pred_y = lr_reg.predict(X)
+    assert pred_y[:3] == approx(2/3, abs=1e-3)
+    assert pred_y[3:] == approx(1/3, abs=1e-3)
+
+def test_classifier_as_regressor_out_buffer():
+    lr = LogisticRegression(penalty=None)
+    lr_reg = ClassifierAsRegressor(lr)
+    X, y = _make_data()
+    lr_reg.fit(X, y)
+
+    out = np.empty(len(X))
+    pred_y = lr_reg.predict(X, out=out)
+    assert pred_y is out
+    assert out[:3] == approx(2/3, abs=1e-3)
+    assert out[3:] == approx(1/3, abs=1e-3)
+
 def test_classifier_as_regressor_log_proba():
     lr = LogisticRegression(penalty=None)
     lr_reg = ClassifierAsRegressor(lr, response_method="predict_log_proba")
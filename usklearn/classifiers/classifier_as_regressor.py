@@ -5,6 +5,8 @@ By default return predicted probabilities as numeric predictions.
 """
 
 
+import numpy as np
+
 from sklearn.base import BaseEstimator, RegressorMixin
 
 class ClassifierAsRegressor(BaseEstimator, RegressorMixin):
@@ -32,6 +34,12 @@ class ClassifierAsRegressor(BaseEstimator, RegressorMixin):
         predict method.
 
     """
+    # attributes which must never be forwarded to the wrapped estimator
+    _own_attrs = frozenset(("estimator", "fitted_estimator_",
+                            "response_method", "pos_label",
+                            "_pos_label", "_bound_resp",
+                            "_output_is_matrix"))
+
     def __init__(self, estimator, response_method='predict_proba',
                  pos_label=1):
         super().__init__()
@@ -40,25 +48,72 @@ class ClassifierAsRegressor(BaseEstimator, RegressorMixin):
         self.pos_label = pos_label
     def fit(self, *args, **kwargs):
         self.fitted_estimator_ = self.estimator.fit(*args, **kwargs)
+        self._pos_label = int(self.pos_label)
+        self._bound_resp = getattr(self.fitted_estimator_,
+                                   self.response_method)
+        # the output dimensionality of the response method is an
+        # invariant of the fitted model; probe it on one row now so
+        # predict can skip the per-call check
+        self._output_is_matrix = None
+        if args:
+            try:
+                probe = self._bound_resp(args[0][:1])
+            except Exception:
+                # never fail fit because of the probe; predict will
+                # check dimensionality itself
+                probe = None
+            if probe is not None:
+                if probe.ndim > 2:
+                    raise RuntimeError("ClassifierAsRegressor: response"
+                                       " method must return a vector of"
+                                       " a matrix.")
+                self._output_is_matrix = (probe.ndim == 2)
+        # seed frequently probed fitted attributes into __dict__ so
+        # later lookups take the fast __getattribute__ path instead of
+        # falling through to __getattr__; refitting must overwrite the
+        # seeds and drop those the new fitted estimator lacks
+        for name in ("classes_", "n_features_in_", "feature_names_in_"):
+            try:
+                self.__dict__[name] = getattr(self.fitted_estimator_,
+                                              name)
+            except AttributeError:
+                self.__dict__.pop(name, None)
         return self
-    def predict(self, *args, **kwargs):
-        resp_method = getattr(self.fitted_estimator_, self.response_method)
+    def predict(self, *args, out=None, **kwargs):
+        """Predict using the wrapped classifier's response method.
+
+        If out is given, predictions are written into it and it is
+        returned, avoiding a fresh allocation per call in batched
+        scoring loops.  It must be a float array of shape
+        (n_samples,)."""
+        resp_method = self.__dict__.get("_bound_resp")
+        if resp_method is None:
+            # models fitted before the method was bound at fit time
+            resp_method = getattr(self.fitted_estimator_,
+                                  self.response_method)
         preds = resp_method(*args, **kwargs)
-        pred_ndim = len(preds.shape)
-        if pred_ndim > 2:
-            raise RuntimeError("ClassifierAsRegressor: response method"
-                               " must return a vector of a matrix.")
-        elif pred_ndim == 2:
-            preds = preds[:,self.pos_label]
+        output_is_matrix = self.__dict__.get("_output_is_matrix")
+        if output_is_matrix is None:
+            if preds.ndim > 2:
+                raise RuntimeError("ClassifierAsRegressor: response method"
+                                   " must return a vector of a matrix.")
+            output_is_matrix = (preds.ndim == 2)
+        if output_is_matrix:
+            pos_label = self.__dict__.get("_pos_label")
+            if pos_label is None:
+                # models fitted before _pos_label was cached
+                pos_label = int(self.pos_label)
+            return np.take(preds, pos_label, axis=1, out=out)
+        if out is not None:
+            out[...] = preds
+            return out
         return preds
 
     def __getattr__(self, name):
-        if name in ["fitted_estimator_", "response_method", "pos_label"]:
-            try:
-                return self.__dict__[name]
-            except:
-                raise AttributeError(f"ClassifierAsRegressor has"
-                                     " no attribute {name}")
+        # only reached when name is not in __dict__
+        if name in self._own_attrs:
+            raise AttributeError(f"ClassifierAsRegressor has"
+                                 f" no attribute {name}")
         if "fitted_estimator_" not in self.__dict__:
             return getattr(self.estimator, name)
         return getattr(self.fitted_estimator_, name)
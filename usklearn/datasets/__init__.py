@@ -4,6 +4,8 @@ popular uplift reference datasets. It also features some artificial
 data generators.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .Hillstrom import fetch_Hillstrom
 from .Lalonde import fetch_Lalonde
 from .TelecomChurn import fetch_TelecomChurn
@@ -22,3 +24,24 @@ from .BMT import fetch_BMT
 from .Tamoxifen import fetch_Tamoxifen
 from .pbc import fetch_pbc
 from .uis import fetch_uis
+
+
+def fetch_all(fetchers, **kwargs):
+    """Fetch several datasets concurrently.
+
+    fetchers is a sequence of dataset fetch functions, e.g.
+    ``[fetch_uis, fetch_Hillstrom]``.  They are run in a thread pool:
+    fetch time is dominated by network I/O and C-level parsing which
+    release the GIL, so independent datasets are fetched nearly in
+    parallel.  Distinct datasets are safe to fetch concurrently;
+    fetching the same dataset from several threads at once is not
+    supported since concurrent fetches race on its cache files.
+    Keyword arguments are passed to every fetcher.  Returns the list
+    of results in the order of fetchers.
+    """
+    fetchers = list(fetchers)
+    if not fetchers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(fetchers))) as executor:
+        futures = [executor.submit(f, **kwargs) for f in fetchers]
+        return [f.result() for f in futures]
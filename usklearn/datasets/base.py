@@ -16,6 +16,12 @@ from inspect import isfunction
 
 import numpy as np
 
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pa_csv
+except ImportError:
+    _pa = _pa_csv = None
+
 import joblib
 from sklearn.utils import Bunch
 from sklearn.utils import check_random_state
@@ -73,6 +79,124 @@ def _fetch_remote(remote, dirname=None):
                                                       remote.checksum))
     return file_path
 
+def _encode_categ_column(x, categs, attr_dtype):
+    """Encode a categorical column through the categs mapping.
+
+    Vectorized replacement for ``[categs[c] for c in x]``: category
+    lookup is done with a single searchsorted pass so the whole encoded
+    column is produced in one allocation.  Raises KeyError on values
+    not present in categs, like the dict lookup would."""
+    x = np.asarray(x)
+    keys = list(categs.keys())
+    values = list(categs.values())
+    # fast path: consecutive integer strings mapped to consecutive
+    # codes, e.g. {"1":0, "2":1, ...}; parse the digits directly
+    # instead of looking categories up
+    if values == list(range(len(keys))):
+        try:
+            base = int(keys[0])
+        except ValueError:
+            base = None
+        if (base is not None
+                and keys == [str(base + i) for i in range(len(keys))]):
+            try:
+                codes = x.astype(np.int64) - base
+            except ValueError:
+                codes = None
+            if codes is not None:
+                # astype accepts non-canonical spellings like "02" or
+                # "+1" which a category lookup must reject, so require
+                # that the parsed codes round-trip to the raw strings;
+                # out of range or non-canonical values fall through to
+                # the lookup path below, which raises KeyError
+                valid = (codes >= 0) & (codes < len(keys))
+                if (valid.all()
+                        and (np.char.mod("%d", codes + base) == x).all()):
+                    return codes.astype(attr_dtype, copy=False)
+    keys = np.array(keys)
+    values = np.array(values, dtype=attr_dtype)
+    order = np.argsort(keys)
+    idx = np.take(order, np.searchsorted(keys, x, sorter=order),
+                  mode="clip")
+    invalid = keys[idx] != x
+    if invalid.any():
+        raise KeyError(x[invalid][0])
+    return values[idx]
+
+# cache of encoded categorical columns keyed on a digest of the raw
+# column, so repeated encodes are free without retaining the raw
+# strings for the life of the process
+_categ_cache = OrderedDict()
+_CATEG_CACHE_SIZE = 32
+
+def _encode_categ_column_cached(x, categs, attr_dtype):
+    """Memoized _encode_categ_column.
+
+    Identical raw columns encoded with identical category mappings are
+    encoded only once per process.  Returns a fresh copy so mutating
+    the result cannot poison the cache."""
+    x = np.asarray(x)
+    key = (hashlib.blake2b(x.tobytes(), digest_size=16).digest(),
+           tuple(categs.items()), np.dtype(attr_dtype).str)
+    enc = _categ_cache.get(key)
+    if enc is None:
+        enc = _encode_categ_column(x, categs, attr_dtype)
+        if len(_categ_cache) >= _CATEG_CACHE_SIZE:
+            _categ_cache.popitem(last=False)
+        _categ_cache[key] = enc
+    return enc.copy()
+
+def _read_csv_pyarrow(archive, header, delimiter, quotechar,
+                      column_dtypes={}):
+    """Read CSV columns using pyarrow's SIMD csv parser.
+
+    Much faster than the csv module since parsing happens in C with the
+    GIL released.  Columns listed in column_dtypes (mapping CSV column
+    name to numpy dtype) are converted to typed arrays directly by the
+    parser; remaining columns are read as strings so that the result
+    matches the layout produced by the csv module fallback.  Returns
+    (Xy_columns, header)."""
+    skip_rows = 0
+    if isinstance(archive, str):
+        if header is None:
+            if archive.endswith(".gz"):
+                f_context = gzip.open(archive, mode="rt")
+            else:
+                f_context = open(archive, mode="rt")
+            with f_context as f:
+                header = next(f).strip().split(delimiter)
+            skip_rows = 1
+        if archive.endswith(".gz"):
+            source = _pa.input_stream(archive, compression="gzip")
+        else:
+            # mmap the file so the parser iterates over kernel
+            # page-cached bytes without an extra read() copy
+            source = _pa.memory_map(archive)
+    else:
+        contents = archive.read()
+        if header is None:
+            header = contents[:contents.index("\n")].strip().split(delimiter)
+            skip_rows = 1
+        source = _pa.BufferReader(contents.encode("utf-8"))
+    column_types = {c:(_pa.from_numpy_dtype(column_dtypes[c])
+                       if c in column_dtypes else _pa.string())
+                    for c in header}
+    read_options = _pa_csv.ReadOptions(column_names=header,
+                                       skip_rows=skip_rows)
+    parse_options = _pa_csv.ParseOptions(delimiter=delimiter,
+                                         quote_char=quotechar)
+    # null_values=[] so malformed numeric fields raise instead of
+    # silently becoming null, matching the numpy conversion fallback
+    convert_options = _pa_csv.ConvertOptions(column_types=column_types,
+                                             null_values=[])
+    table = _pa_csv.read_csv(source, read_options=read_options,
+                             parse_options=parse_options,
+                             convert_options=convert_options)
+    Xy_columns = [c.to_pylist() if _pa.types.is_string(c.type)
+                  else c.combine_chunks().to_numpy(zero_copy_only=False)
+                  for c in table.itercolumns()]
+    return Xy_columns, header
+
 def _read_csv(archive, feature_attrs, treatment_attrs, target_attrs,
               total_attrs=None, categ_as_strings=False, header=None,
               csv_reader_args={"delimiter":",", "quotechar":'"'},
@@ -117,43 +241,69 @@ def _read_csv(archive, feature_attrs, treatment_attrs, target_attrs,
                     categs = {c:c for c in attr_dtype}
                 else: # dict
                     categs = attr_dtype
-                maxlen = max(len(c) for c in attr_dtype.values())
+                maxlen = max(len(c) for c in categs.values())
                 attr_dtype = f"U{maxlen}"
             else:
                 categs = {c:i for i, c in enumerate(attr_dtype)}
                 attr_dtype = np.int32
-            x = [categs[c] for c in x]
+            x = _encode_categ_column_cached(x, categs, attr_dtype)
         elif isfunction(attr_dtype):
             x, attr_dtype = attr_dtype(x)
-        x = np.array(x, dtype=attr_dtype)
+        x = np.asarray(x, dtype=attr_dtype)
         return x, attr_name
 
     Xy = []
-    if isinstance(archive, str):
-        if archive.endswith(".gz"):
-            f_context = gzip.open(archive, mode="rt")
-        else:
-            f_context = open(archive, mode="rt")
+    if not isinstance(archive, str) and not hasattr(archive, "read"):
+        raise ValueError("_read_csv: archive argument "
+                         "must be a string or file-like object.")
+    if (_pa_csv is not None and not all_num
+            and set(csv_reader_args) <= {"delimiter", "quotechar"}):
+        # columns with plain numpy dtypes are typed inside the C
+        # parser; categorical and callable-converted columns are read
+        # as strings and handled by parse_attr
+        column_dtypes = {}
+        for a_descr in (list(treatment_attrs) + list(target_attrs)
+                        + list(feature_attrs)):
+            attr_dtype = a_descr[1]
+            if (isinstance(attr_dtype, (list, dict))
+                    or isfunction(attr_dtype)):
+                continue
+            file_attr_name = a_descr[2] if len(a_descr) == 3 else a_descr[0]
+            column_dtypes[file_attr_name] = np.dtype(attr_dtype)
+        Xy_columns, header = _read_csv_pyarrow(
+            archive, header,
+            delimiter=csv_reader_args.get("delimiter", ","),
+            quotechar=csv_reader_args.get("quotechar", '"'),
+            column_dtypes=column_dtypes)
+        if total_attrs is not None:
+            assert len(Xy_columns) == total_attrs, (len(Xy_columns),
+                                                    total_attrs)
     else:
-        if not hasattr(archive, "read"):
-            raise ValueError("_read_csv: archive argument "
-                             "must be a string or file-like object.")
-        f_context = archive
-    with f_context as csvfile:
-        if header is None:
-            delim = csv_reader_args.get("delimiter", ",")
-            header = next(csvfile).strip().split(delim)
-        if all_num:
-            Xy_columns = np.loadtxt(csvfile, unpack=True, **csv_reader_args)
-            if total_attrs is not None:
-                assert len(Xy_columns) == total_attrs, (record, total_attrs)
+        if isinstance(archive, str):
+            if archive.endswith(".gz"):
+                f_context = gzip.open(archive, mode="rt")
+            else:
+                f_context = open(archive, mode="rt")
         else:
-            csvreader = csv.reader(csvfile, **csv_reader_args)
-            for record in csvreader:
-                Xy.append(record)
+            f_context = archive
+        with f_context as csvfile:
+            if header is None:
+                delim = csv_reader_args.get("delimiter", ",")
+                header = next(csvfile).strip().split(delim)
+            if all_num:
+                Xy_columns = np.loadtxt(csvfile, unpack=True,
+                                        **csv_reader_args)
                 if total_attrs is not None:
-                    assert len(record) == total_attrs, (record, total_attrs)
-            Xy_columns = list(zip(*Xy))
+                    assert len(Xy_columns) == total_attrs, (record,
+                                                            total_attrs)
+            else:
+                csvreader = csv.reader(csvfile, **csv_reader_args)
+                for record in csvreader:
+                    Xy.append(record)
+                    if total_attrs is not None:
+                        assert len(record) == total_attrs, (record,
+                                                            total_attrs)
+                Xy_columns = list(zip(*Xy))
     if isinstance(archive, str):
         remove(archive)
     
@@ -219,6 +369,21 @@ def _read_csv(archive, feature_attrs, treatment_attrs, target_attrs,
     ret.categ_values=categ_values
     return ret
 
+def _columns_to_table(D, as_frame):
+    """Change the list of columns in D.data into a 2-d table.
+
+    A pandas DataFrame if as_frame is True, otherwise a float array if
+    all columns are floats and an object array if not."""
+    if as_frame:
+        import pandas
+        D.data = pandas.DataFrame(OrderedDict(zip(D.feature_names, D.data)))
+    else:
+        all_float = all((x.dtype.kind=="f") for x in D.data)
+        if not all_float:
+            for i, c in enumerate(D.data):
+                D.data[i] = c.astype(object)
+        D.data = np.column_stack(D.data)
+
 def _prepare_final_data(D, shuffle, return_X_y,
                         record_mask=None,
                         random_state=None):
@@ -233,7 +398,10 @@ def _prepare_final_data(D, shuffle, return_X_y,
         ind = np.arange(D.data.shape[0])
         rng = check_random_state(random_state)
         rng.shuffle(ind)
-        D.data = D.data.iloc[ind]
+        if hasattr(D.data, "iloc"): # pandas DataFrame
+            D.data = D.data.iloc[ind]
+        else:
+            D.data = D.data[ind]
         for ta in D.target_names:
             D[ta] = D[ta][ind] 
         for ta in D.treatment_names:
@@ -308,15 +476,7 @@ def _fetch_remote_csv(remote, dataset_name,
             if a in D.categ_values:
                 del D.categ_values[a]
     # change columns into a table
-    if as_frame:
-        import pandas
-        D.data = pandas.DataFrame(OrderedDict(zip(D.feature_names, D.data)))
-    else:
-        all_float = all((x.dtype.kind=="f") for x in D.data)
-        if not all_float:
-            for i, c in enumerate(D.data):
-                D.data[i] = c.astype(object)
-        D.data = np.column_stack(D.data)
+    _columns_to_table(D, as_frame)
 
     # final returned data
     ret = _prepare_final_data(D, shuffle, return_X_y,
@@ -2,14 +2,98 @@
 
 """
 
+from os.path import join
+from importlib.resources import files, as_file
+
 import numpy as np
 
+import joblib
+from sklearn.utils import Bunch
+from sklearn.datasets import get_data_home
+
 from .base import _fetch_remote_csv
+from .base import _columns_to_table, _prepare_final_data
 from .base import RemoteFileMetadata
 
 ARCHIVE = RemoteFileMetadata(
     filename=None, url=('local:uis_data'), checksum=None)
 
+# dictionaries for categorical variables
+_HC_VALUES = ["1", "2", "3", "4"]  # Heroin/Cocaine use
+_IV_VALUES = ["1", "2", "3"]      # IV drug use history
+
+# attribute descriptions, built once at module level
+# 0/1 valued columns are stored as int8 to save memory bandwidth in
+# downstream split-finding loops; NDT spans 0-40 so int16 suffices
+_TREATMENT_DESCR = (("treatment", np.int8, "TREAT"),
+                    )
+
+_TARGET_DESCR = (("target_time", float, "TIME"),
+                 ("target_censor", np.int8, "CENSOR"),
+                 ("target_log_time", float, "Y"),
+                 ("target_FRAC", float, "FRAC"))
+
+_FEATURE_DESCR = (("AGE", float),
+                  ("BECK", float),
+                  ("HC", _HC_VALUES),
+                  ("IV", _IV_VALUES),
+                  ("NDT", np.int16),
+                  ("RACE", np.int8),
+                  ("SITE", np.int8),
+                  ("LEN.T", float),
+                  ("ND1", float),
+                  ("ND2", float),
+                  ("LNDT", float),
+                  ("IV3", np.int8))
+
+def _load_uis_npz(categ_as_strings, as_frame):
+    """Build the UIS data Bunch from the uis.npz file shipped with the
+    package.
+
+    The npz (generated by scripts/prepare_uis_npz.py) stores
+    already-typed columns with categorical variables as integer codes,
+    so loading needs no parsing or encoding."""
+    resource = files("usklearn.datasets").joinpath("data", "uis.npz")
+    with as_file(resource) as path:
+        npz = np.load(path)
+        columns = []
+        categ_values = {}
+        for attr_name, attr_dtype in _FEATURE_DESCR:
+            col = npz[attr_name]
+            if isinstance(attr_dtype, list):
+                categ_values[attr_name] = list(attr_dtype)
+                if categ_as_strings:
+                    col = np.asarray(attr_dtype)[col]
+            columns.append(col)
+        ret = Bunch(data=columns,
+                    treatment_names=[a[0] for a in _TREATMENT_DESCR],
+                    feature_names=[a[0] for a in _FEATURE_DESCR],
+                    target_names=[a[0] for a in _TARGET_DESCR])
+        for attr_name in ret.target_names:
+            ret[attr_name] = npz[attr_name]
+        ret.treatment = npz["treatment"]
+        ret.treatment_values = [0, 1]
+        ret.n_trt = 1
+        ret.categ_values = categ_values
+    _columns_to_table(ret, as_frame)
+    return ret
+
+# joblib.Memory cache for parsed fetch results, created on first use
+_memory = None
+
+def _fetch_uis_cached(**kwargs):
+    """Memoized version of _fetch_remote_csv for the UIS dataset.
+
+    Repeat calls with the same arguments load a pickled result from a
+    joblib.Memory cache instead of re-parsing and re-encoding the CSV.
+    The cache key includes ARCHIVE (and thus its checksum), so updating
+    the data invalidates cached entries."""
+    global _memory
+    if _memory is None:
+        _memory = joblib.Memory(join(get_data_home(), "uplift_sklearn",
+                                     "joblib_cache"), verbose=0)
+    return _memory.cache(_fetch_remote_csv)(ARCHIVE, "uis", **kwargs)
+
 
 def fetch_uis(data_home=None, download_if_missing=True,
               random_state=None, shuffle=False,
@@ -123,42 +207,25 @@ def fetch_uis(data_home=None, download_if_missing=True,
 
     """
 
-    # dictionaries for categorical variables
-    hc_values = ["1", "2", "3", "4"]  # Heroin/Cocaine use
-    iv_values = ["1", "2", "3"]      # IV drug use history
-
-    # attribute descriptions
-    treatment_descr = [("treatment", np.int32, "TREAT"),
-                       ]
-    
-    target_descr = [("target_time", float, "TIME"),
-                    ("target_censor", np.int32, "CENSOR"),
-                    ("target_log_time", float, "Y"),
-                    ("target_FRAC", float, "FRAC")]
-
-    feature_descr = [("AGE", float),
-                     ("BECK", float),
-                     ("HC", hc_values),
-                     ("IV", iv_values),
-                     ("NDT", float),
-                     ("RACE", np.int32),
-                     ("SITE", np.int32),
-                     ("LEN.T", float),
-                     ("ND1", float),
-                     ("ND2", float),
-                     ("LNDT", float),
-                     ("IV3", np.int32)]
-
-    ret = _fetch_remote_csv(ARCHIVE, "uis",
-                            feature_attrs=feature_descr,
-                            treatment_attrs=treatment_descr,
-                            target_attrs=target_descr,
-                            categ_as_strings=categ_as_strings,
-                            return_X_y=return_X_y, as_frame=as_frame,
-                            download_if_missing=download_if_missing,
-                            random_state=random_state, shuffle=shuffle,
-                            total_attrs=17
-                            )
+    try:
+        D = _load_uis_npz(categ_as_strings, as_frame)
+        ret = _prepare_final_data(D, shuffle, return_X_y,
+                                  random_state=random_state)
+    except FileNotFoundError:
+        # no npz shipped, fall back to parsing the embedded CSV
+        kwargs = dict(feature_attrs=_FEATURE_DESCR,
+                      treatment_attrs=_TREATMENT_DESCR,
+                      target_attrs=_TARGET_DESCR,
+                      categ_as_strings=categ_as_strings,
+                      return_X_y=return_X_y, as_frame=as_frame,
+                      download_if_missing=download_if_missing,
+                      random_state=random_state, shuffle=shuffle,
+                      total_attrs=17)
+        if shuffle and random_state is None:
+            # result is nondeterministic, bypass the cache
+            ret = _fetch_remote_csv(ARCHIVE, "uis", **kwargs)
+        else:
+            ret = _fetch_uis_cached(**kwargs)
     if not return_X_y:
         ret.descr = __doc__
     return ret